@@ -1,11 +1,14 @@
+import array
 import dataclasses
+import functools
+import itertools
+import math
+import types
 from dataclasses import dataclass
 import typing as tp
-from class_only_design import ClassOnly
 
-
-class PitchMapping(ClassOnly):
-    PITCHES_TO_INDEX: tp.ClassVar[tp.Mapping[str, int]] = {
+_PITCHES_TO_INDEX: tp.Mapping[str, int] = types.MappingProxyType(
+    {
         "C": 0,
         "B#": 0,
         "C#": 1,
@@ -28,9 +31,11 @@ class PitchMapping(ClassOnly):
         "B": 11,
         "Cb": 11,
     }
+)
 
-    # tuple to handle enharmonics, first example is the sharp version, second is the flat version
-    INDEX_TO_PITCHES: tp.ClassVar[tp.Mapping[int, str]] = {
+# tuple to handle enharmonics, first example is the sharp version, second is the flat version
+_INDEX_TO_PITCHES: tp.Mapping[int, tp.Tuple[str, str]] = types.MappingProxyType(
+    {
         0: ("C", "C"),
         1: ("Db", "C#"),
         2: ("D", "D"),
@@ -44,6 +49,82 @@ class PitchMapping(ClassOnly):
         10: ("Bb", "A#"),
         11: ("B", "B"),
     }
+)
+
+_SHORT_NAMES: tp.Mapping[int, str] = types.MappingProxyType(
+    {
+        0: "P1",
+        1: "m2",
+        2: "M2",
+        3: "m3",
+        4: "M3",
+        5: "P4",
+        6: "TT",
+        7: "P5",
+        8: "m6",
+        9: "M6",
+        10: "m7",
+        11: "M7",
+        12: "P8",
+    }
+)
+
+_LONG_NAMES: tp.Mapping[int, str] = types.MappingProxyType(
+    {
+        0: "Unison",
+        1: "Minor Second",
+        2: "Major Second",
+        3: "Minor Third",
+        4: "Major Third",
+        5: "Perfect Fourth",
+        6: "Tritone",
+        7: "Perfect Fifth",
+        8: "Minor Sixth",
+        9: "Major Sixth",
+        10: "Minor Seventh",
+        11: "Major Seventh",
+        12: "Octave",
+    }
+)
+
+_SHORT_NAMES_TO_INTERVALS: tp.Mapping[str, int] = types.MappingProxyType(
+    {
+        "P1": 0,
+        "m2": 1,
+        "M2": 2,
+        "m3": 3,
+        "M3": 4,
+        "P4": 5,
+        "TT": 6,
+        "P5": 7,
+        "m6": 8,
+        "M6": 9,
+        "m7": 10,
+        "M7": 11,
+        "P8": 12,
+    }
+)
+
+_SCALES: tp.Mapping[str, tp.Sequence[int]] = types.MappingProxyType(
+    {
+        "MAJOR": (2, 2, 1, 2, 2, 2, 1),
+        "IONION": (2, 2, 1, 2, 2, 2, 1),
+        "DORIAN": (2, 1, 2, 2, 2, 1, 2),
+        "PHRYGIAN": (1, 2, 2, 2, 1, 2, 2),
+        "LYDIAN": (2, 2, 2, 1, 2, 2, 1),
+        "MIXOLYDIAN": (2, 2, 1, 2, 2, 1, 2, 2),
+        "AEOLIAN": (2, 1, 2, 2, 1, 2, 2),
+        "MINOR": (2, 1, 2, 2, 1, 2, 2),
+        "LOCRIAN": (1, 2, 2, 1, 2, 2, 2),
+    }
+)
+
+
+class PitchMapping:
+    PITCHES_TO_INDEX: tp.ClassVar[tp.Mapping[str, int]] = _PITCHES_TO_INDEX
+    INDEX_TO_PITCHES: tp.ClassVar[tp.Mapping[int, tp.Tuple[str, str]]] = (
+        _INDEX_TO_PITCHES
+    )
     BASE_TONES: tp.ClassVar[tp.List[str]] = [
         "C",
         "D",
@@ -57,35 +138,90 @@ class PitchMapping(ClassOnly):
     A4_FREQ = 440
 
     @classmethod
-    def get_base_tones(cls, base):
-        idx = cls.BASE_TONES.index(base)
-        return cls.BASE_TONES[idx:] + cls.BASE_TONES[:idx]
+    def get_base_tones(cls, base) -> tp.Tuple[str, ...]:
+        return _ROTATED_BASE_TONES[base]
+
+
+# BASE_TONES rotated to start on each tone
+_ROTATED_BASE_TONES: tp.Mapping[str, tp.Tuple[str, ...]] = types.MappingProxyType(
+    {
+        base: tuple(PitchMapping.BASE_TONES[idx:] + PitchMapping.BASE_TONES[:idx])
+        for idx, base in enumerate(PitchMapping.BASE_TONES)
+    }
+)
+
+# INDEX_TO_PITCHES flattened, the spelling of index i is at 2 * i + int(sharp)
+_ENHARMONICS: tp.Tuple[str, ...] = tuple(
+    note for index in range(12) for note in _INDEX_TO_PITCHES[index]
+)
+
+# frequency ratio of each semitone within an octave
+_SEMITONE_RATIO: tp.Tuple[float, ...] = tuple(2 ** (k / 12.0) for k in range(12))
+
+
+def _offset_to_freq(offset_c0: int) -> float:
+    # whole octaves only scale the exponent, the remainder comes from the ratio table
+    octaves, semitones = divmod(offset_c0 - PitchMapping.A4_OFFSET, 12)
+    return math.ldexp(PitchMapping.A4_FREQ * _SEMITONE_RATIO[semitones], octaves)
 
 
-@dataclass
+# frequencies for every semitone from C0 up to B10, indexed by offset from C0
+_FREQ_BY_C0_OFFSET: tp.Tuple[float, ...] = tuple(
+    _offset_to_freq(offset) for offset in range(12 * 11)
+)
+
+
+def _freq_from_offset(offset_c0: int) -> float:
+    if 0 <= offset_c0 < len(_FREQ_BY_C0_OFFSET):
+        return _FREQ_BY_C0_OFFSET[offset_c0]
+    return _offset_to_freq(offset_c0)
+
+
+# interval names for -12..12 semitones, descending intervals share the ascending name
+_SHORT_BY_SIGNED: tp.Tuple[str, ...] = tuple(
+    _SHORT_NAMES[abs(interval)] for interval in range(-12, 13)
+)
+_LONG_BY_SIGNED: tp.Tuple[str, ...] = tuple(
+    _LONG_NAMES[abs(interval)] for interval in range(-12, 13)
+)
+
+# distance of every scale degree from the root, e.g. MAJOR -> (0, 2, 4, 5, 7, 9, 11, 12)
+_SCALE_CUMSUM: tp.Mapping[str, tp.Tuple[int, ...]] = types.MappingProxyType(
+    {
+        name: tuple(itertools.accumulate(intervals, initial=0))
+        for name, intervals in _SCALES.items()
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Pitch:
     note: str
     octave: int = 4
+    _offset_c0: int = dataclasses.field(init=False, repr=False, compare=False)
+    _repr: str = dataclasses.field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.note not in PitchMapping.PITCHES_TO_INDEX:
-            raise ValueError(f"Invalid note: {self.note}")
-        self._offset_c0 = PitchMapping.PITCHES_TO_INDEX[self.note] + 12 * self.octave
-        offset_a4 = self._offset_c0 - PitchMapping.A4_OFFSET
-        self._freq = PitchMapping.A4_FREQ * (2 ** (offset_a4 / 12.0))
+        try:
+            index = _PITCHES_TO_INDEX[self.note]
+        except KeyError:
+            raise ValueError(f"Invalid note: {self.note}") from None
+        offset_c0 = index + 12 * self.octave
+        object.__setattr__(self, "_offset_c0", offset_c0)
+        object.__setattr__(self, "_repr", f"{self.note}{self.octave}")
 
     def __sub__(self, other) -> int:
         return self._offset_c0 - other._offset_c0
 
     def __str__(self):
-        return f"{self.note}{self.octave}"
+        return self._repr
 
     def __repr__(self):
-        return f"{self.note}{self.octave}"
+        return self._repr
 
     @property
-    def freq(self):
-        return self._freq
+    def freq(self) -> float:
+        return _freq_from_offset(self._offset_c0)
 
     @property
     def base_tone(self):
@@ -94,8 +230,8 @@ class Pitch:
     def has_enharmonic(self) -> bool:
         return self.note in ("C#", "Db", "D#", "Eb", "F#", "Gb", "G#", "Ab", "A#", "Bb")
 
-    def toggle_enharmonic(self, sharp=True) -> None:
-        self.note = PitchMapping.INDEX_TO_PITCHES[self._offset_c0 % 12][int(sharp)]
+    def toggle_enharmonic(self, sharp=True) -> "Pitch":
+        return pitch(_ENHARMONICS[(self._offset_c0 % 12) * 2 + int(sharp)], self.octave)
 
     # TODO: Handle enharmonics
     def step(self, semitones: int, reset_octave=False) -> "Pitch":
@@ -106,150 +242,166 @@ class Pitch:
         if target < 0:
             raise ArithmeticError("Cannot step below C0")
 
-        octave = self.octave if reset_octave else target // 12
-        new_note = PitchMapping.INDEX_TO_PITCHES[target % 12][0]
+        return _pitch_from_offset(target, self.octave if reset_octave else None)
 
-        return Pitch(
-            note=new_note,
-            octave=octave,
-        )
 
+# pitches are immutable, so equal (note, octave) pairs can share one instance
+_PITCH_CACHE: tp.Dict[tp.Tuple[str, int], Pitch] = {}
 
-@dataclass
+
+def pitch(note: str, octave: int = 4) -> Pitch:
+    key = (note, octave)
+    cached = _PITCH_CACHE.get(key)
+    if cached is None:
+        cached = _PITCH_CACHE[key] = Pitch(note, octave)
+    return cached
+
+
+def _pitch_from_offset(offset: int, octave: tp.Optional[int] = None) -> Pitch:
+    note = _ENHARMONICS[(offset % 12) * 2]
+    return pitch(note, offset // 12 if octave is None else octave)
+
+
+@dataclass(slots=True)
 class Interval:
-    SHORT_NAMES: tp.ClassVar[tp.Mapping[int, str]] = {
-        0: "P1",
-        1: "m2",
-        2: "M2",
-        3: "m3",
-        4: "M3",
-        5: "P4",
-        6: "TT",
-        7: "P5",
-        8: "m6",
-        9: "M6",
-        10: "m7",
-        11: "M7",
-        12: "P8",
-    }
-    LONG_NAMES: tp.ClassVar[tp.Mapping[int, str]] = {
-        0: "Unison",
-        1: "Minor Second",
-        2: "Major Second",
-        3: "Minor Third",
-        4: "Major Third",
-        5: "Perfect Fourth",
-        6: "Tritone",
-        7: "Perfect Fifth",
-        8: "Minor Sixth",
-        9: "Major Sixth",
-        10: "Minor Seventh",
-        11: "Major Seventh",
-        12: "Octave",
-    }
-    SHORT_NAMES_TO_INTERVALS: tp.ClassVar[tp.Mapping[str, int]] = {
-        "P1": 0,
-        "m2": 1,
-        "M2": 2,
-        "m3": 3,
-        "M3": 4,
-        "P4": 5,
-        "TT": 6,
-        "P5": 7,
-        "m6": 8,
-        "M6": 9,
-        "m7": 10,
-        "M7": 11,
-        "P8": 12,
-    }
+    SHORT_NAMES: tp.ClassVar[tp.Mapping[int, str]] = _SHORT_NAMES
+    LONG_NAMES: tp.ClassVar[tp.Mapping[int, str]] = _LONG_NAMES
+    SHORT_NAMES_TO_INTERVALS: tp.ClassVar[tp.Mapping[str, int]] = (
+        _SHORT_NAMES_TO_INTERVALS
+    )
     interval: int
 
     @classmethod
     def from_name(cls, name: str) -> "Interval":
-        return cls(cls.SHORT_NAMES_TO_INTERVALS[name])
+        return cls(_SHORT_NAMES_TO_INTERVALS[name])
 
-    @property
-    def name(self, short=True):
-        # TODO : Handle octave
-        offset = self.interval if self.interval < 0 else 12 - self.interval
+    def name(self, short=True) -> str:
+        # TODO : Handle compound intervals
+        if not -12 <= self.interval <= 12:
+            raise ValueError(f"Interval out of range: {self.interval}")
+        offset = self.interval + 12
 
-        return self.SHORT_NAMES[offset] if short else self.LONG_NAMES[offset]
+        return _SHORT_BY_SIGNED[offset] if short else _LONG_BY_SIGNED[offset]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleSequence:
-    SCALES: tp.ClassVar[tp.Mapping[str, tp.Sequence[int]]] = {
-        "MAJOR": (2, 2, 1, 2, 2, 2, 1),
-        "IONION": (2, 2, 1, 2, 2, 2, 1),
-        "DORIAN": (2, 1, 2, 2, 2, 1, 2),
-        "PHRYGIAN": (1, 2, 2, 2, 1, 2, 2),
-        "LYDIAN": (2, 2, 2, 1, 2, 2, 1),
-        "MIXOLYDIAN": (2, 2, 1, 2, 2, 1, 2, 2),
-        "AEOLIAN": (2, 1, 2, 2, 1, 2, 2),
-        "MINOR": (2, 1, 2, 2, 1, 2, 2),
-        "LOCRIAN": (1, 2, 2, 1, 2, 2, 2),
-    }
+    SCALES: tp.ClassVar[tp.Mapping[str, tp.Sequence[int]]] = _SCALES
 
     root: Pitch
     sequence: dataclasses.InitVar[tp.Union[tp.Sequence[int], str]] = "MAJOR"
+    pitches: tp.List[Pitch] = dataclasses.field(init=False, repr=False, compare=False)
+    tones: tp.List[str] = dataclasses.field(init=False, repr=False, compare=False)
+    freqs: array.array = dataclasses.field(init=False, repr=False, compare=False)
+    triads: tp.Tuple[tp.Tuple[Pitch, Pitch, Pitch], ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    extended_triads: tp.Tuple[tp.Tuple[Pitch, Pitch, Pitch, Pitch], ...] = (
+        dataclasses.field(init=False, repr=False, compare=False)
+    )
 
     def __post_init__(self, sequence):
         if isinstance(sequence, str):
-            if sequence.upper() not in self.SCALES:
+            if sequence.upper() not in _SCALE_CUMSUM:
                 raise ValueError(f"Invalid Scale Description : {sequence}")
-            sequence = self.SCALES[sequence.upper()]
+            distances = _SCALE_CUMSUM[sequence.upper()]
+        else:
+            distances = tuple(itertools.accumulate(sequence, initial=0))
         pitches = [self.root]
-        base_tones = PitchMapping.get_base_tones(self.root.base_tone)
-
-        for idx, interval in enumerate(sequence):
-            step = pitches[-1].step(interval, reset_octave=True)
-            if idx != len(sequence) - 1:
-                if step.base_tone != base_tones[idx + 1]:
-                    step.toggle_enharmonic(sharp=True)
-            pitches.append(step)
+        base_tones = _ROTATED_BASE_TONES[self.root.base_tone]
+        root_offset = self.root._offset_c0
+        last = len(distances) - 1
+
+        for idx, distance in enumerate(distances[1:], start=1):
+            index = (root_offset + distance) % 12
+            note = _ENHARMONICS[index * 2]
+            if idx != last and note[0] != base_tones[idx]:
+                note = _ENHARMONICS[index * 2 + 1]
+            pitches.append(pitch(note, self.root.octave))
         self.pitches = pitches
-        self.tones = [pitch.note for pitch in self.pitches]
+        self.tones = [p.note for p in pitches]
+        # ascending degree frequencies (unlike pitches, which keep the root's octave)
+        # as a float64 buffer that can be wrapped without copying (numpy.frombuffer)
+        self.freqs = array.array(
+            "d", [_freq_from_offset(root_offset + distance) for distance in distances]
+        )
 
-    @property
-    def triads(self, extended=False):
-        n = len(self.pitches)
-        for i in range(n - 1):
-            if extended:
-                yield self.pitches[i], self.pitches[(i + 2) % n], self.pitches[
-                    (i + 4) % n
-                ], self.pitches[(i + 6) % n]
+        n = len(pitches)
+        self.triads = tuple(
+            (pitches[i], pitches[(i + 2) % n], pitches[(i + 4) % n])
+            for i in range(n - 1)
+        )
+        self.extended_triads = tuple(
+            (
+                pitches[i],
+                pitches[(i + 2) % n],
+                pitches[(i + 4) % n],
+                pitches[(i + 6) % n],
+            )
+            for i in range(n - 1)
+        )
 
-            else:
-                yield self.pitches[i], self.pitches[(i + 2) % n], self.pitches[
-                    (i + 4) % n
-                ]
 
+@functools.lru_cache(maxsize=None)
+def _build_fretboard(
+    tuning_offsets: tp.Tuple[int, ...], n_frets: int
+) -> tp.Tuple[tp.Tuple[int, ...], ...]:
+    # strings are stored from the highest (string 1) down to the lowest
+    frets = range(n_frets + 1)
+    return tuple(
+        tuple(offset + fret for fret in frets) for offset in reversed(tuning_offsets)
+    )
 
-@dataclass
+
+_STANDARD_TUNING: tp.Tuple[tp.Tuple[str, int], ...] = (
+    ("E", 2),
+    ("A", 2),
+    ("D", 3),
+    ("G", 3),
+    ("B", 3),
+    ("E", 4),
+)
+_STANDARD_N_FRETS = 24
+
+
+@dataclass(slots=True)
 class Guitar:
     tuning: tp.Sequence[Pitch] = dataclasses.field(
         default_factory=lambda: [
-            Pitch("E", 2),
-            Pitch("A", 2),
-            Pitch("D", 3),
-            Pitch("G", 3),
-            Pitch("B", 3),
-            Pitch("E", 4),
+            pitch(note, octave) for note, octave in _STANDARD_TUNING
         ]
     )
-    n_frets: int = 24
+    n_frets: int = _STANDARD_N_FRETS
+    fretboard_offsets: tp.Tuple[tp.Tuple[int, ...], ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _fretboard: tp.Optional[tp.List[tp.List[Pitch]]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        self.fretboard = []
-
-        for string in self.tuning:
-            self.fretboard.append(
-                [string.step(fret) for fret in range(self.n_frets + 1)]
-            )
+        # pitches are only materialized on access, the board itself is offsets from C0
+        self.fretboard_offsets = _build_fretboard(
+            tuple(string._offset_c0 for string in self.tuning), self.n_frets
+        )
 
-    def __getitem__(self, string):
-        string = len(self.tuning) - string
-        return self.fretboard[string]
+    @property
+    def fretboard(self) -> tp.List[tp.List[Pitch]]:
+        # materialized once on first access, open strings keep the tuning's spelling
+        if self._fretboard is None:
+            self._fretboard = [
+                [open_string] + [_pitch_from_offset(offset) for offset in offsets[1:]]
+                for open_string, offsets in zip(
+                    reversed(self.tuning), self.fretboard_offsets
+                )
+            ]
+        return self._fretboard
+
+    def __getitem__(self, string) -> tp.List[Pitch]:
+        # strings are numbered from 1 (highest) to len(tuning) (lowest)
+        if string < 1:
+            raise IndexError(f"Invalid string: {string}")
+        return self.fretboard[string - 1]
 
 
 if __name__ == "__main__":